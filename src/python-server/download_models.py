@@ -7,11 +7,15 @@ import os
 import sys
 from pathlib import Path
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict
 
 MODELS_DIR = Path(__file__).parent / "models"
 MODELS_DIR.mkdir(exist_ok=True)
 
+# Voices downloaded at the same time
+DOWNLOAD_CONCURRENCY = int(os.environ.get("BOOKREADER_DOWNLOAD_CONCURRENCY", "4"))
+
 # Model download URLs (from Piper releases)
 VOICE_MODELS = {
     "en_US-lessac-medium": {
@@ -34,11 +38,36 @@ def download_file(url: str, destination: Path):
     try:
         urllib.request.urlretrieve(url, destination)
         size_mb = destination.stat().st_size / (1024 * 1024)
-        print(f"  ✓ Downloaded {size_mb:.1f} MB")
+        print(f"  ✓ Downloaded {destination.name} ({size_mb:.1f} MB)")
     except Exception as e:
-        print(f"  ✗ Failed: {e}")
+        print(f"  ✗ Failed: {destination.name}: {e}")
         raise
 
+def download_voice(voice_name: str) -> bool:
+    """Download one voice's model and config; returns False (cleaned up) on failure."""
+    urls = VOICE_MODELS[voice_name]
+    model_file = MODELS_DIR / f"{voice_name}.onnx"
+    config_file = MODELS_DIR / f"{voice_name}.onnx.json"
+
+    try:
+        # Download model
+        if not model_file.exists():
+            download_file(urls["model_url"], model_file)
+
+        # Download config
+        if not config_file.exists():
+            download_file(urls["config_url"], config_file)
+
+        print(f"✓ {voice_name}: done")
+        return True
+
+    except Exception as e:
+        print(f"  ✗ Failed to download {voice_name}: {e}")
+        # Clean up partial downloads
+        model_file.unlink(missing_ok=True)
+        config_file.unlink(missing_ok=True)
+        return False
+
 def check_existing_models() -> Dict[str, bool]:
     """Check which models already exist."""
     existing = {}
@@ -77,38 +106,18 @@ def main():
         print(f"\nTotal download size: ~{len(to_download) * 60} MB")
         print()
 
-    downloaded = 0
-    failed = 0
-
-    for voice_name, urls in VOICE_MODELS.items():
+    for voice_name in VOICE_MODELS:
         if existing[voice_name]:
             print(f"\n✓ {voice_name}: Already present (skipping)")
-            continue
 
-        print(f"\n{voice_name}:")
-
-        model_file = MODELS_DIR / f"{voice_name}.onnx"
-        config_file = MODELS_DIR / f"{voice_name}.onnx.json"
+    # Voices are independent network-bound downloads: fetch them concurrently so the
+    # total time is the slowest voice rather than the sum of all of them, capped so a
+    # long voice list doesn't trip the model host's rate limits
+    with ThreadPoolExecutor(max_workers=max(1, min(DOWNLOAD_CONCURRENCY, len(to_download)))) as pool:
+        results = list(pool.map(download_voice, to_download))
 
-        try:
-            # Download model
-            if not model_file.exists():
-                download_file(urls["model_url"], model_file)
-
-            # Download config
-            if not config_file.exists():
-                download_file(urls["config_url"], config_file)
-
-            downloaded += 1
-
-        except Exception as e:
-            print(f"  ✗ Failed to download {voice_name}: {e}")
-            failed += 1
-            # Clean up partial downloads
-            if model_file.exists():
-                model_file.unlink()
-            if config_file.exists():
-                config_file.unlink()
+    downloaded = sum(results)
+    failed = len(results) - downloaded
 
     print("\n" + "=" * 50)
     if failed == 0:
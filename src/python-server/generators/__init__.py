@@ -1,5 +1,5 @@
 """Pronunciation generators package."""
-from .tts import generate_audio
+from .tts import generate_audio, generate_audio_bytes
 from .ipa import generate_ipa
 
-__all__ = ['generate_audio', 'generate_ipa']
+__all__ = ['generate_audio', 'generate_audio_bytes', 'generate_ipa']
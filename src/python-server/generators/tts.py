@@ -1,7 +1,7 @@
 """Text-to-Speech generator using Piper TTS (Offline Neural Voices)."""
 import asyncio
 import base64
-import tempfile
+import io
 import os
 import wave
 from typing import Optional
@@ -100,7 +100,7 @@ def get_voice(language: str) -> Optional[PiperVoice]:
         return None
 
 
-async def generate_audio(text: str, language: str = "en") -> Optional[str]:
+def generate_audio_bytes_sync(text: str, language: str = "en") -> Optional[bytes]:
     """
     Generate WAV audio with Piper TTS (offline).
 
@@ -109,14 +109,12 @@ async def generate_audio(text: str, language: str = "en") -> Optional[str]:
         language: Language code ('en', 'de', 'ru')
 
     Returns:
-        Base64-encoded WAV audio string, or None if generation fails
+        WAV file bytes, or None if generation fails
     """
     if not text or not text.strip():
         print("[TTS] Error: Empty text provided")
         return None
 
-    temp_file = None
-
     try:
         # Get voice for language
         voice = get_voice(language)
@@ -124,56 +122,40 @@ async def generate_audio(text: str, language: str = "en") -> Optional[str]:
             print(f"[TTS] Error: Could not load voice for language: {language}")
             return None
 
-        # Create temp file for WAV output
-        fd, temp_file = tempfile.mkstemp(suffix='.wav')
-        os.close(fd)
-
         text_preview = text[:50] + '...' if len(text) > 50 else text
         print(f"[TTS] Generating: text='{text_preview}' lang={language}")
 
-        # Generate audio with Piper
-        audio_chunks = list(voice.synthesize(text))
-
-        if not audio_chunks:
+        # Generate audio with Piper, writing each chunk straight into an in-memory
+        # WAV (no temp file round trip, no joined copy of all the samples)
+        buffer = io.BytesIO()
+        wav_file = None
+        first_chunk = None
+        try:
+            for chunk in voice.synthesize(text):
+                if wav_file is None:
+                    # First chunk carries the format info for the WAV headers
+                    first_chunk = chunk
+                    wav_file = wave.open(buffer, 'wb')
+                    wav_file.setnchannels(chunk.sample_channels)
+                    wav_file.setsampwidth(chunk.sample_width)
+                    wav_file.setframerate(chunk.sample_rate)
+                wav_file.writeframes(chunk.audio_int16_bytes)
+        finally:
+            if wav_file is not None:
+                wav_file.close()  # Patches the header sizes; leaves the buffer open
+
+        if first_chunk is None:
             print("[TTS] Error: No audio chunks generated")
             return None
 
-        # Get first chunk for format info
-        first_chunk = audio_chunks[0]
-
-        # Collect all audio bytes
-        all_audio_bytes = b''.join(chunk.audio_int16_bytes for chunk in audio_chunks)
-
-        # Write WAV file with proper headers
-        with wave.open(temp_file, 'wb') as wav_file:
-            wav_file.setnchannels(first_chunk.sample_channels)
-            wav_file.setsampwidth(first_chunk.sample_width)
-            wav_file.setframerate(first_chunk.sample_rate)
-            wav_file.writeframes(all_audio_bytes)
-
-        # Verify file was created and has content
-        if not os.path.exists(temp_file):
-            print(f"[TTS] Error: Temp file not created")
-            return None
-
-        file_size = os.path.getsize(temp_file)
-        if file_size == 0:
-            print(f"[TTS] Error: Generated file is empty")
-            return None
-
-        print(f"[TTS] Generated audio: {file_size} bytes ({first_chunk.sample_rate}Hz, {first_chunk.sample_width*8}bit, {first_chunk.sample_channels}ch)")
-
-        # Read WAV file and encode to base64
-        with open(temp_file, 'rb') as f:
-            audio_data = f.read()
-
+        audio_data = buffer.getvalue()
         if not audio_data:
-            print(f"[TTS] Error: Could not read audio data")
+            print("[TTS] Error: Generated audio is empty")
             return None
 
-        base64_data = base64.b64encode(audio_data).decode('utf-8')
-        print(f"[TTS] Success: Encoded to base64 ({len(base64_data)} chars)")
-        return base64_data
+        print(f"[TTS] Generated audio: {len(audio_data)} bytes ({first_chunk.sample_rate}Hz, {first_chunk.sample_width*8}bit, {first_chunk.sample_channels}ch)")
+
+        return audio_data
 
     except Exception as e:
         error_type = type(e).__name__
@@ -182,18 +164,42 @@ async def generate_audio(text: str, language: str = "en") -> Optional[str]:
         traceback.print_exc()
         return None
 
-    finally:
-        # Clean up temp file
-        if temp_file and os.path.exists(temp_file):
-            try:
-                os.remove(temp_file)
-            except Exception as e:
-                print(f"[TTS] Warning: Could not remove temp file: {e}")
-
 
 def generate_audio_sync(text: str, language: str = "en") -> Optional[str]:
     """
-    Synchronous wrapper for generate_audio.
+    Generate WAV audio with Piper TTS (offline), base64-encoded.
+
+    Returns:
+        Base64-encoded WAV audio string, or None if generation fails
+    """
+    audio_data = generate_audio_bytes_sync(text, language)
+    if audio_data is None:
+        return None
+
+    base64_data = base64.b64encode(audio_data).decode('utf-8')
+    print(f"[TTS] Success: Encoded to base64 ({len(base64_data)} chars)")
+    return base64_data
+
+
+async def generate_audio_bytes(text: str, language: str = "en") -> Optional[bytes]:
+    """
+    Generate WAV audio bytes without blocking the event loop.
+
+    Args:
+        text: Text to synthesize
+        language: Language code
+
+    Returns:
+        WAV file bytes, or None if generation fails
+    """
+    return await asyncio.to_thread(generate_audio_bytes_sync, text, language)
+
+
+async def generate_audio(text: str, language: str = "en") -> Optional[str]:
+    """
+    Generate audio without blocking the event loop.
+
+    Piper synthesis is CPU-bound, so it runs in a worker thread.
 
     Args:
         text: Text to synthesize
@@ -202,7 +208,7 @@ def generate_audio_sync(text: str, language: str = "en") -> Optional[str]:
     Returns:
         Base64-encoded audio string, or None if generation fails
     """
-    return asyncio.run(generate_audio(text, language))
+    return await asyncio.to_thread(generate_audio_sync, text, language)
 
 
 # For testing